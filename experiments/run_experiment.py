@@ -5,8 +5,11 @@ Experimental evaluation of algorithms for the
 Degree-Constrained Minimum Spanning Tree (DC-MST) problem.
 """
 
+import os
+import random
 import time
 import csv
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict,Tuple
 
 from instances.generator import generate_feasible_instance
@@ -15,6 +18,7 @@ from src.greedy import greedy_dc_mst
 from src.local_search import local_search_dc_mst
 from src.simulated_annealing import simulated_annealing
 from src.tabu_search import tabu_search
+from src.utils.graph import make_graph
 
 ALGORITHMS = {
     "BruteForce": brute_force_dc_mst,
@@ -34,6 +38,50 @@ def density(num_vertices: int, num_edges: int) -> float:
     return num_edges / max_edges
 
 
+def run_algorithm(name: str, algorithm, instance: Dict,
+                  degree_bounds: Dict[int, int], initial_solution: list,
+                  seed=None):
+    """
+    Runs one algorithm with the arguments it expects.
+    """
+    if name == "Greedy":
+        return algorithm(
+            instance,
+            degree_bounds
+        )
+
+    if name == "SimulatedAnnealing":
+        return algorithm(
+            instance,
+            degree_bounds,
+            initial_solution,
+            rng=random.Random(seed)
+        )
+
+    # Exact bound, metaheuristics and local search
+    return algorithm(
+        instance,
+        degree_bounds,
+        initial_solution
+    )
+
+
+def warm_up():
+    """
+    Runs every algorithm once on a tiny instance and discards the result,
+    so one-time costs (lazy imports, caches, interpreter specialization
+    of the hot loops) are not charged to the first timed run.
+    """
+    vertices = set(range(4))
+    edges = [(u, v) for u in range(4) for v in range(u + 1, 4)]
+    instance = make_graph(vertices, edges, {e: 1 + sum(e) for e in edges})
+    degree_bounds = {v: 2 for v in vertices}
+
+    initial_solution, _ = greedy_dc_mst(instance, degree_bounds)
+    for name, algorithm in ALGORITHMS.items():
+        run_algorithm(name, algorithm, instance, degree_bounds, initial_solution)
+
+
 def run_single_experiment(config: Dict) -> list[Dict]:
     """
     Runs one experiment instance and measures performance.
@@ -47,11 +95,7 @@ def run_single_experiment(config: Dict) -> list[Dict]:
     )
     density_value = density(len(vertices), len(edges)) 
        
-    instance = {
-        "vertices": vertices,
-        "edges": edges,
-        "weights": weights
-    }
+    instance = make_graph(vertices, edges, weights)
 
     results = []
 
@@ -61,22 +105,14 @@ def run_single_experiment(config: Dict) -> list[Dict]:
     )
 
     for name, algorithm in ALGORITHMS.items():
-        start = time.time()
-
-        if name  in ("BruteForce", "Greedy"):
-            solution, cost = algorithm(
-                instance, 
-                degree_bounds
-            )
-    
-        else:  # Metaheuristics and local search
-            solution, cost = algorithm(
-                instance,
-                degree_bounds,
-                initial_solution
-            )
-
-        elapsed = time.time() - start
+        start = time.perf_counter()
+
+        solution, cost = run_algorithm(
+            name, algorithm, instance, degree_bounds, initial_solution,
+            seed=config["seed"]
+        )
+
+        elapsed = time.perf_counter() - start
 
         results.append( {
             "Algorithm": name,
@@ -92,30 +128,33 @@ def run_experiments(configs: List[Dict], output_file: str):
     """
     Runs all experiments and saves results to a single CSV file.
     Each row corresponds to one algorithm executed on one instance.
+
+    Instances are independent, so they are solved in parallel worker
+    processes (each warmed up once); results are collected in
+    configuration order and written by the main process.
     """
 
     if not configs:
         return
 
-    # Run once to infer CSV schema
-    first_results = run_single_experiment(configs[0])
+    with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                             initializer=warm_up) as executor:
+        all_results = list(executor.map(run_single_experiment, configs))
 
-    if not first_results:
+    if not all_results[0]:
         return
 
-    fieldnames = list(first_results[0].keys())
-
-    with open(output_file, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    fieldnames = list(all_results[0][0].keys())
+    rows = [
+        tuple(result[key] for key in fieldnames)
+        for results in all_results
+        for result in results
+    ]
 
-        for config in configs:
-            results = run_single_experiment(config)
-            
-            for result in results:
-                writer.writerow(result)
-                
-        f.flush()
+    with open(output_file, "w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
 
 if __name__ == "__main__":
     experiment_configs = [
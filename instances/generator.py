@@ -5,8 +5,9 @@ Random instance generator for the
 Degree-Constrained Minimum Spanning Tree (DC-MST) problem.
 """
 
+import itertools
 import random
-from typing import List, Tuple, Dict, Set
+from typing import List, Optional, Tuple, Dict, Set
 
 
 Edge = Tuple[int, int]
@@ -17,7 +18,7 @@ def generate_graph(num_vertices: int,
                    edge_probability: float,
                    weight_range: Tuple[int, int],
                    degree_bound: int,
-                   seed: int ):
+                   seed: Optional[int] = None):
     """
     Generates a random undirected weighted graph
     with uniform degree constraints.
@@ -33,7 +34,8 @@ def generate_graph(num_vertices: int,
     degree_bound : int
         Maximum degree allowed for each vertex.
     seed : int, optional
-        Random seed for reproducibility.
+        Random seed for reproducibility. A private generator is used,
+        so the module-level random state is left untouched.
 
     Returns
     -------
@@ -41,19 +43,22 @@ def generate_graph(num_vertices: int,
     edges : list of Edge
     degree_bounds : dict
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = random.Random(seed)
 
     vertices: Set[int] = set(range(num_vertices))
     edges: List[Edge] = []
     weights: Weight = {}
-
-    for i in range(num_vertices):
-        for j in range(i + 1, num_vertices):
-            if random.random() < edge_probability:
-                weight = random.randint(*weight_range)
-                edges.append((i, j))
-                weights[(i, j)] = weight
+    low, high = weight_range
+    draw = rng.random
+    randint = rng.randint
+    add_edge = edges.append
+
+    # One Bernoulli trial per pair i < j, immediately followed by the
+    # weight draw of a kept edge, so seeded instances stay unchanged.
+    for edge in itertools.combinations(range(num_vertices), 2):
+        if draw() < edge_probability:
+            add_edge(edge)
+            weights[edge] = randint(low, high)
 
     degree_bounds: Dict[int, int] = {v: degree_bound for v in vertices}
 
@@ -65,24 +70,36 @@ def generate_feasible_instance(num_vertices: int,
                                weight_range: Tuple[int, int],
                                degree_bound: int,
                                max_attempts: int = 100,
-                               **seed: int):
+                               seed: Optional[int] = None):
     """
     Generates an instance that is likely to admit
     at least one feasible spanning tree.
 
-    Retries generation if graph is too sparse.
+    Retries generation if graph is too sparse,
+    with seed + attempt as the seed of each retry
+    (the first attempt uses seed).
+
+    Degree bounds that no spanning tree can satisfy
+    are rejected up front: a spanning tree has n-1 edges,
+    so the bounds must add up to at least 2(n-1).
 
     Returns
     -------
     vertices, edges, degree_bounds
     """
-    for _ in range(max_attempts):
+    if degree_bound * num_vertices < 2 * (num_vertices - 1):
+        raise ValueError(
+            f"Degree bound {degree_bound} admits no spanning tree "
+            f"on {num_vertices} vertices."
+        )
+
+    for attempt in range(max_attempts):
         vertices, edges, weights, degree_bounds = generate_graph(
             num_vertices,
             edge_probability,
             weight_range,
             degree_bound,
-            **seed
+            None if seed is None else seed + attempt
         )
 
         # A necessary (but not sufficient) condition:
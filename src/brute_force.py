@@ -6,51 +6,132 @@ Minimum Spanning Tree (DC-MST) problem.
 
 This implementation enumerates all possible spanning trees,
 checks degree constraints, and selects the minimum-cost solution.
+The enumeration is a branch and bound: edges are decided in
+non-decreasing weight order and branches that cannot beat the best
+tree found so far are cut.
 
 Intended for small instances only.
 """
 
-import itertools
-from typing import List, Tuple, Dict, Set
-from src.utils.union_find import UnionFind
+from typing import Dict, List, Optional, Tuple
 from src.utils.graph import (
-    is_connected,
-    respects_degree_constraints,
-    total_cost,
+    is_tree,
+    mask_cost,
+    mask_respects_degree_constraints,
+    mask_to_tree,
+    tree_mask,
     Edge,
-    
-    
 )
 
 
-
-def has_cycle(vertices: Set[int], edges: List[Edge]) -> bool:
+def _bf_kernel(us: List[int],
+               vs: List[int],
+               ws: List[float],
+               bits: List[int],
+               bounds: List[int],
+               n: int,
+               best_cost: float) -> Tuple[Optional[int], float]:
     """
-    Checks whether the given edges contain a cycle
-    using Union-Find logic.
+    Branch-and-bound search over edges sorted by weight.
+
+    Iterative include/exclude enumeration with an inlined rollback
+    Union-Find (union by rank, no path compression) and an explicit
+    stack of included edges, so the whole search runs in one frame.
+
+    Returns the best tree mask strictly cheaper than best_cost
+    (None if there is none) and its cost.
     """
-    union_find = UnionFind(vertices)   
-        
-    for u, v in edges:
-        if not union_find.union(u, v):
-            return True
+    m = len(us)
+    prefix = [0] * (m + 1)
+    for k in range(m):
+        prefix[k + 1] = prefix[k] + ws[k]
+
+    parent = list(range(n))
+    rank = [0] * n
+    degree = [0] * n
+    stack = []
+    best_mask = None
+
+    k = 0
+    mask = 0
+    cost = 0
+    missing = n - 1
+
+    while True:
+        if missing == 0:
+            if cost < best_cost:
+                best_cost = cost
+                best_mask = mask
+        elif (m - k >= missing
+              and cost + prefix[k + missing] - prefix[k] < best_cost):
+            u, v = us[k], vs[k]
+            if degree[u] < bounds[u] and degree[v] < bounds[v]:
+                ru = u
+                while parent[ru] != ru:
+                    ru = parent[ru]
+                rv = v
+                while parent[rv] != rv:
+                    rv = parent[rv]
+
+                if ru != rv:
+                    if rank[ru] < rank[rv]:
+                        ru, rv = rv, ru
+                    parent[rv] = ru
+                    grew = rank[ru] == rank[rv]
+                    if grew:
+                        rank[ru] += 1
+                    stack.append((k, rv, ru, grew))
+                    degree[u] += 1
+                    degree[v] += 1
+                    mask |= bits[k]
+                    cost += ws[k]
+                    missing -= 1
+                    k += 1
+                    continue
+
+            k += 1
+            continue
 
-    return False
+        # Backtrack: undo the latest included edge and exclude it instead.
+        if not stack:
+            break
+        k, rv, ru, grew = stack.pop()
+        parent[rv] = rv
+        if grew:
+            rank[ru] -= 1
+        degree[us[k]] -= 1
+        degree[vs[k]] -= 1
+        mask ^= bits[k]
+        cost -= ws[k]
+        missing += 1
+        k += 1
+
+    return best_mask, best_cost
 
 
 def brute_force_dc_mst(graph,
-                       degree_bounds: Dict[int, int]) -> Tuple[list, float]:
+                       degree_bounds: Dict[int, int],
+                       initial_solution: Optional[list[Edge]] = None
+                       ) -> Tuple[list, float]:
     """
     Brute-force solver for DC-MST.
 
+    Edges are decided one at a time (include / exclude) in
+    non-decreasing weight order while a rollback Union-Find keeps the
+    chosen edges acyclic, so every complete branch is a spanning tree
+    and each tree is visited at most once. A branch is cut when a
+    partial degree exceeds its bound, or when its cost plus the
+    cheapest edges still needed cannot beat the best tree so far.
+
     Parameters
     ----------
-    vertices : set of int
-        Vertex identifiers.
-    edges : list of Edge
-        All possible edges.
+    graph : dict
+        Graph built by make_graph.
     degree_bounds : dict
         Maximum allowed degree for each vertex.
+    initial_solution : Tree, optional
+        Known feasible tree (e.g. the greedy one) used as the
+        starting upper bound.
 
     Returns
     -------
@@ -58,28 +139,34 @@ def brute_force_dc_mst(graph,
         Optimal degree-constrained spanning tree.
     """
     vertices = graph["vertices"]
-    edges = graph["edges"]
+    src = graph["src"]
+    dst = graph["dst"]
+    w = graph["w"]
     n = len(vertices)
-    best_tree = None
-    best_cost = float("inf")
-
-    for candidate in itertools.combinations(edges, n - 1):
-        candidate = list(candidate)
 
-        if has_cycle(vertices, candidate):
-            continue
-
-        if not is_connected(vertices, candidate):
-            continue
-
-        if not respects_degree_constraints(candidate, degree_bounds):
-            continue
-
-        cost = total_cost(graph, candidate)
-        if cost < best_cost:
-            best_cost = cost
-            best_tree = candidate
-
-    if best_tree is None:
+    best_mask = None
+    best_cost = float("inf")
+    if initial_solution is not None and is_tree(vertices, initial_solution):
+        initial_mask = tree_mask(graph, initial_solution)
+        if mask_respects_degree_constraints(graph, initial_mask, degree_bounds):
+            best_mask = initial_mask
+            best_cost = mask_cost(graph, initial_mask)
+
+    order = graph["order"]
+    bounds = [degree_bounds[v] for v in range(n)]
+    kernel_mask, kernel_cost = _bf_kernel(
+        [src[i] for i in order],
+        [dst[i] for i in order],
+        [w[i] for i in order],
+        [1 << i for i in order],
+        bounds,
+        n,
+        best_cost,
+    )
+    if kernel_mask is not None:
+        best_mask, best_cost = kernel_mask, kernel_cost
+
+    if best_mask is None:
         raise ValueError("No feasible degree-constrained spanning tree found.")
+    best_tree = mask_to_tree(graph, best_mask)
     return best_tree,best_cost
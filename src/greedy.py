@@ -35,14 +35,15 @@ def greedy_dc_mst(graph,degree_bounds: Dict[int, int]) -> Tuple[list[Edge], floa
         Degree-constrained spanning tree (heuristic).
     """
     vertices = graph["vertices"]
-    edges = graph["edges"]
-    sorted_edges = sorted(edges, key=lambda e: e[1])
-    uf = UnionFind(vertices)
+    src = graph["src"]
+    dst = graph["dst"]
+    uf = UnionFind(len(vertices))
 
     degree = {v: 0 for v in vertices}
     tree: list[Edge] = []
 
-    for u, v in sorted_edges:
+    for i in graph["order"]:
+        u, v = src[i], dst[i]
         if uf.find(u) != uf.find(v):
             if degree[u] < degree_bounds[u] and degree[v] < degree_bounds[v]:
                 tree.append((u, v))
@@ -9,51 +9,30 @@ using edge-swap neighborhood exploration.
 """
 
 from typing import List, Tuple, Dict, Set
-from collections import defaultdict, deque
 from src.utils.graph import (
-    
-    build_adjacency,
+    edge_key,
+    is_tree,
+    replacement_edges,
     respects_degree_constraints,
+    root_tree,
     total_cost,
     Edge,
     )
 
 
-def connected_components_after_removal(vertices: Set[int],
-                                       tree: list[Edge],
-                                       removed_edge: Edge) -> List[Set[int]]:
-    """
-    Returns the connected components obtained after removing one edge.
-    """
-    u, v = removed_edge
-    remaining_edges = [e for e in tree if e != removed_edge]
-
-    adj = build_adjacency(vertices, remaining_edges)
-
-    visited = set()
-    components = []
-
-    for start in vertices:
-        if start not in visited:
-            comp = set()
-            queue = deque([start])
-            while queue:
-                current = queue.popleft()
-                if current not in visited:
-                    visited.add(current)
-                    comp.add(current)
-                    queue.extend(adj[current] - visited)
-            components.append(comp)
-
-    return components
-
-
 def local_search_dc_mst(graph,
                         degree_bounds: Dict[int, int],
                         initial_tree: list[Edge]) -> Tuple[list[Edge], float]:
     """
     Local search algorithm for DC-MST.
 
+    An edge (u, v) can replace a tree edge iff that tree edge lies on the
+    tree path between u and v. These replacement lists are computed
+    once per accepted swap from a DFS numbering of the rooted tree, so
+    each removed edge only visits the edges that can replace it, lightest
+    first: the first feasible improving swap is the best one for that
+    removed edge.
+
     Parameters
     ----------
     vertices : set of int
@@ -70,50 +49,68 @@ def local_search_dc_mst(graph,
     Tree
         Improved solution (local optimum).
     """
-    
+
     vertices= graph['vertices']
-    edges= graph['edges']
+    src = graph["src"]
+    dst = graph["dst"]
+    w = graph["w"]
+    edge_index = graph["edge_index"]
     current_tree = initial_tree[:]
     current_cost = total_cost(graph, current_tree)
 
+    if (not is_tree(vertices, current_tree)
+            or not respects_degree_constraints(current_tree, degree_bounds)):
+        return current_tree,current_cost
+
+    tree_ids = [edge_index[edge_key(u, v)] for u, v in current_tree]
+    bounds = [degree_bounds[v] for v in range(len(vertices))]
+    degree = [0] * len(vertices)
+    for u, v in current_tree:
+        degree[u] += 1
+        degree[v] += 1
+
     improved = True
     while improved:
         improved = False
-
-        for edge_in in list(current_tree):
-            components = connected_components_after_removal(
-                vertices, current_tree, edge_in
-            )
-
-            if len(components) != 2:
-                continue
-
-            comp_a, comp_b = components
-
-            for u, v in edges:
-                if (u in comp_a and v in comp_b) or (u in comp_b and v in comp_a):
-                    if (u, v) in current_tree or (v, u) in current_tree:
-                        continue
-
-                    candidate_tree = current_tree[:]
-                    candidate_tree.remove(edge_in)
-                    candidate_tree.append((u, v))
-
-                    if not respects_degree_constraints(candidate_tree, degree_bounds):
-                        continue
-
-                    candidate_cost = total_cost(graph, candidate_tree)
-
-                    if candidate_cost < current_cost:
-                        current_tree = candidate_tree
-                        current_cost = candidate_cost
-                        improved = True
-                        break
-
-                if improved:
+        parent, tin, tout = root_tree(
+            vertices, [(src[j], dst[j]) for j in tree_ids]
+        )
+        replacements = replacement_edges(graph, tree_ids, parent, tin, tout)
+
+        for pos, out_id in enumerate(tree_ids):
+            a, b = src[out_id], dst[out_id]
+            w_out = w[out_id]
+
+            for i in replacements[out_id]:
+                # Replacements come lightest first, so once one is not
+                # cheaper than the removed edge none of the rest is.
+                delta = w[i] - w_out
+                if delta >= 0:
                     break
 
+                # Evaluate the swap in place: only u and v gain a
+                # degree (unless they are also endpoints of out_id).
+                u, v = src[i], dst[i]
+                degree[a] -= 1
+                degree[b] -= 1
+                feasible = degree[u] < bounds[u] and degree[v] < bounds[v]
+                degree[a] += 1
+                degree[b] += 1
+                if not feasible:
+                    continue
+
+                degree[a] -= 1
+                degree[b] -= 1
+                degree[u] += 1
+                degree[v] += 1
+                del tree_ids[pos]
+                tree_ids.append(i)
+                current_cost += delta
+                improved = True
+                break
+
             if improved:
                 break
 
+    current_tree = [(src[j], dst[j]) for j in tree_ids]
     return current_tree,current_cost
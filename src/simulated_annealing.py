@@ -1,12 +1,14 @@
 import math
 import random
-from copy import deepcopy
 
 from src.utils.graph import (
-
-    respects_degree_constraints,
-    total_cost,
-    generate_neighbor
+    edge_ids_from_mask,
+    generate_neighbors,
+    mask_cost,
+    mask_respects_degree_constraints,
+    mask_to_tree,
+    swap_respects_degree_constraints,
+    tree_mask,
 )
 
 
@@ -17,7 +19,9 @@ def simulated_annealing(
     initial_temperature=1000.0,
     cooling_rate=0.995,
     min_temperature=1e-3,
-    max_iterations=10000
+    max_iterations=10000,
+    rng=None,
+    batch_size=32
 ):
     """
     Simulated Annealing for Degree-Constrained MST.
@@ -30,47 +34,86 @@ def simulated_annealing(
         Maximum degree for each vertex.
     initial_solution : set
         Initial feasible spanning tree.
+    rng : random.Random, optional
+        Source of the random draws; a fresh unseeded generator by
+        default. Pass random.Random(seed) for reproducible runs.
+    batch_size : int
+        Number of moves proposed from the current tree at once; they
+        are tested in order and the first accepted one is applied.
+
+    Solutions are handled internally as edge-index bitmasks, with the
+    current tree also kept as a list of edge ids to draw moves from.
     """
 
-    current_solution = deepcopy(initial_solution)
-    best_solution = deepcopy(initial_solution)
+    if rng is None:
+        rng = random.Random()
+
+    w = graph["w"]
+    bounds = [degree_bounds[v] for v in range(len(graph["vertices"]))]
+    current_solution = tree_mask(graph, initial_solution)
+    current_ids = edge_ids_from_mask(current_solution)
+    best_solution = current_solution
+    current_feasible = mask_respects_degree_constraints(
+        graph, current_solution, bounds
+    )
 
-    current_cost = total_cost(graph, current_solution)
+    current_cost = mask_cost(graph, current_solution)
     best_cost = current_cost
 
     temperature = initial_temperature
     iteration = 0
 
+    # The loop runs up to max_iterations times; bind the hot callables
+    # to locals once instead of resolving them every step.
+    uniform = rng.random
+    exp = math.exp
+
     while temperature > min_temperature and iteration < max_iterations:
-        neighbor = generate_neighbor(graph, current_solution)
+        # Until a move is accepted the tree does not change, so up to
+        # batch_size proposals are drawn from one rooting of it and
+        # tested in order until one is accepted.
+        proposed = False
+        for removed_pos, added_edge in generate_neighbors(
+                graph, current_ids, batch_size, rng):
+            proposed = True
+            if temperature <= min_temperature or iteration >= max_iterations:
+                break
+
+            removed_edge = current_ids[removed_pos]
+            neighbor = (current_solution ^ (1 << removed_edge)) | (1 << added_edge)
+            accepted = False
+
+            if current_feasible:
+                neighbor_feasible = swap_respects_degree_constraints(
+                    graph, neighbor, added_edge, bounds
+                )
+            else:
+                neighbor_feasible = mask_respects_degree_constraints(
+                    graph, neighbor, bounds
+                )
+
+            if neighbor_feasible:
+                # The neighbor differs by one swap, so its cost change is O(1).
+                delta = w[added_edge] - w[removed_edge]
+                accepted = delta < 0 or uniform() < exp(-delta / temperature)
+
+            if accepted:
+                current_solution = neighbor
+                current_ids[removed_pos] = added_edge
+                current_cost += delta
+                current_feasible = True
 
-        if neighbor is None:
-            iteration += 1
-            temperature *= cooling_rate
-            continue
+                if current_cost < best_cost:
+                    best_solution = current_solution
+                    best_cost = current_cost
 
-        if not respects_degree_constraints(neighbor, degree_bounds):
-            iteration += 1
             temperature *= cooling_rate
-            continue
-
-        neighbor_cost = total_cost(graph, neighbor)
-        delta = neighbor_cost - current_cost
-
-        if delta < 0:
-            current_solution = neighbor
-            current_cost = neighbor_cost
-        else:
-            acceptance_prob = math.exp(-delta / temperature)
-            if random.random() < acceptance_prob:
-                current_solution = neighbor
-                current_cost = neighbor_cost
+            iteration += 1
 
-        if current_cost < best_cost:
-            best_solution = deepcopy(current_solution)
-            best_cost = current_cost
+            if accepted:
+                break
 
-        temperature *= cooling_rate
-        iteration += 1
+        if not proposed:
+            break
 
-    return best_solution, best_cost
+    return mask_to_tree(graph, best_solution), best_cost
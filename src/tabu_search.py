@@ -1,10 +1,12 @@
 from collections import deque
-from copy import deepcopy
+from operator import itemgetter
 
 from src.utils.graph import (
-    respects_degree_constraints,
-    total_cost,
-    generate_neighbor_with_move
+    mask_cost,
+    mask_respects_degree_constraints,
+    mask_to_tree,
+    neighbor_moves,
+    tree_mask,
 )
 
 
@@ -17,44 +19,72 @@ def tabu_search(
 ):
     """
     Tabu Search for Degree-Constrained MST.
+
+    Solutions are handled internally as edge-index bitmasks, so the
+    cost of a neighbor follows from its move in O(1).
     """
 
-    current_solution = deepcopy(initial_solution)
-    best_solution = deepcopy(initial_solution)
+    src = graph["src"]
+    dst = graph["dst"]
+    w = graph["w"]
+    incidence = graph["incidence"]
+    bounds = [degree_bounds[v] for v in range(len(graph["vertices"]))]
+    current_solution = tree_mask(graph, initial_solution)
+    best_solution = current_solution
+    current_feasible = mask_respects_degree_constraints(
+        graph, current_solution, bounds
+    )
 
-    current_cost = total_cost(graph, current_solution)
+    current_cost = mask_cost(graph, current_solution)
     best_cost = current_cost
 
     tabu_list = deque(maxlen=tabu_tenure)
 
     for _ in range(max_iterations):
-        best_candidate = None
-        best_candidate_cost = float("inf")
-        best_move = None
-
-        for neighbor, move in generate_neighbor_with_move(graph, current_solution):
-            if move in tabu_list:
-                continue
+        # Every candidate is scored independently from the current tree,
+        # so the neighborhood is reduced with a single argmin over the
+        # (removed, added) pairs; only the winning mask is built.
+        candidates = []
+        if current_feasible:
+            # Only the endpoints of the added edge can break a bound, and
+            # one of them loses a degree if it is shared with the removed edge.
+            degree = [
+                (current_solution & incident).bit_count()
+                for incident in incidence
+            ]
+            for move in neighbor_moves(graph, current_solution):
+                if move in tabu_list:
+                    continue
 
-            if not respects_degree_constraints(neighbor, degree_bounds):
-                continue
+                removed_edge, added_edge = move
+                u, v = src[added_edge], dst[added_edge]
+                a, b = src[removed_edge], dst[removed_edge]
+                if (degree[u] - (u == a or u == b) < bounds[u]
+                        and degree[v] - (v == a or v == b) < bounds[v]):
+                    candidates.append((w[added_edge] - w[removed_edge], move))
+        else:
+            for move in neighbor_moves(graph, current_solution):
+                if move in tabu_list:
+                    continue
 
-            cost = total_cost(graph, neighbor)
+                removed_edge, added_edge = move
+                neighbor = (current_solution ^ (1 << removed_edge)) | (1 << added_edge)
+                if mask_respects_degree_constraints(graph, neighbor, bounds):
+                    candidates.append((w[added_edge] - w[removed_edge], move))
 
-            if cost < best_candidate_cost:
-                best_candidate = neighbor
-                best_candidate_cost = cost
-                best_move = move
-
-        if best_candidate is None:
+        if not candidates:
             break
 
-        current_solution = best_candidate
-        current_cost = best_candidate_cost
+        delta, best_move = min(candidates, key=itemgetter(0))
+        removed_edge, added_edge = best_move
+
+        current_solution = (current_solution ^ (1 << removed_edge)) | (1 << added_edge)
+        current_cost += delta
+        current_feasible = True
         tabu_list.append(best_move)
 
         if current_cost < best_cost:
-            best_solution = deepcopy(current_solution)
+            best_solution = current_solution
             best_cost = current_cost
 
-    return best_solution, best_cost
+    return mask_to_tree(graph, best_solution), best_cost
@@ -6,41 +6,97 @@ used in the DC-MST project.
 """
 
 from typing import List, Tuple, Dict, Set
-from collections import defaultdict, deque
 import random
 
+from src.utils.union_find import UnionFind
+
 Edge = Tuple[int, int]
 
 
 
+def edge_key(u: int, v: int) -> Edge:
+    """
+    Canonical (min, max) key of the undirected edge {u, v}, so a tree
+    edge is found whichever way round its endpoints are listed.
+    """
+    return (u, v) if u < v else (v, u)
+
+
+
 def total_cost(graph, tree_edges):
     """
     Computes the total weight of a spanning tree.
     """
+    edge_index = graph["edge_index"]
+    w = graph["w"]
     cost = 0
     for u, v in tree_edges:
-        cost += graph["weights"][(u, v)]
+        cost += w[edge_index[edge_key(u, v)]]
     return cost
 
 
 
-def compute_degrees(tree: list[Edge]) -> Dict[int, int]:
+def tree_cost(graph, tree_ids) -> float:
+    """
+    Computes the total weight of a tree given as edge ids,
+    reading the flat weight array instead of the weight dictionary.
+    """
+    w = graph["w"]
+    return sum(w[i] for i in tree_ids)
+
+
+
+def edge_ids_from_mask(mask: int) -> List[int]:
+    """
+    Decodes an edge-index bitmask (bit i set <=> edge i selected)
+    into the list of selected edge ids.
+    """
+    ids = []
+    while mask:
+        low = mask & -mask
+        ids.append(low.bit_length() - 1)
+        mask ^= low
+    return ids
+
+
+
+def tree_mask(graph, tree_edges) -> int:
+    """
+    Encodes a tree given as (u, v) edges as an edge-index bitmask.
+    """
+    edge_index = graph["edge_index"]
+    mask = 0
+    for u, v in tree_edges:
+        mask |= 1 << edge_index[edge_key(u, v)]
+    return mask
+
+
+
+def mask_cost(graph, mask: int) -> float:
+    """
+    Computes the total weight of a tree given as an edge-index bitmask.
+    """
+    return tree_cost(graph, edge_ids_from_mask(mask))
+
+
+def mask_to_tree(graph, mask: int) -> list[Edge]:
     """
-    Computes the degree of each vertex in a tree.
+    Decodes an edge-index bitmask into a tree of (u, v) edges.
     """
-    degrees = defaultdict(int)
-    for u, v in tree:
-        degrees[u] += 1
-        degrees[v] += 1
-    return degrees
+    src = graph["src"]
+    dst = graph["dst"]
+    return [(src[i], dst[i]) for i in edge_ids_from_mask(mask)]
 
 
 
 def respects_degree_constraints(tree_edges, degree_bounds):
     """
     Checks if all vertices respect their degree constraints.
+
+    degree_bounds has an entry for every vertex id, so the running
+    degrees fit a flat list of that size.
     """
-    degree = defaultdict(int)
+    degree = [0] * len(degree_bounds)
 
     for u, v in tree_edges:
         degree[u] += 1
@@ -54,153 +110,293 @@ def respects_degree_constraints(tree_edges, degree_bounds):
     return True
 
 
-def build_adjacency(vertices: Set[int],
-                    edges: list[Edge]) -> Dict[int, Set[int]]:
+def build_csr(vertices: Set[int],
+              edges: list[Edge]) -> Tuple[List[int], List[int]]:
     """
-    Builds adjacency list from edges.
+    Builds the CSR (Compressed Sparse Row) adjacency of an undirected graph.
+
+    The neighbours of vertex v are indices[indptr[v]:indptr[v + 1]].
+    Vertices are assumed to be labelled 0..n-1.
     """
-    adj = {v: set() for v in vertices}
+    n = len(vertices)
+    indptr = [0] * (n + 1)
     for u, v in edges:
-        adj[u].add(v)
-        adj[v].add(u)
-    return adj
+        indptr[u + 1] += 1
+        indptr[v + 1] += 1
+    for i in range(n):
+        indptr[i + 1] += indptr[i]
 
+    indices = [0] * indptr[n]
+    fill = indptr[:n]
+    for u, v in edges:
+        indices[fill[u]] = v
+        fill[u] += 1
+        indices[fill[v]] = u
+        fill[v] += 1
+    return indptr, indices
 
-def is_connected(vertices: Set[int], edges: list[Edge]) -> bool:
+
+def make_graph(vertices: Set[int],
+               edges: list[Edge],
+               weights: Dict[Edge, float]) -> Dict:
     """
-    Checks whether the graph defined by edges is connected.
+    Builds the graph dictionary shared by all DC-MST solvers.
+
+    Besides the vertex set, edge list and weight dictionary, it stores
+    flat edge-indexed arrays (edge i joins src[i] and dst[i] with
+    weight w[i]), so solvers can work on integer edge ids instead of
+    rebuilding dictionaries.
+    The edge ids sorted by non-decreasing weight are cached in "order",
+    incidence[v] is the bitmask of the edge ids incident to v, and
+    edge_index maps edge_key(u, v) to the id of edge {u, v}.
     """
-    if not vertices:
-        return True
+    w = [weights[e] for e in edges]
+    incidence = [0] * len(vertices)
+    for i, (u, v) in enumerate(edges):
+        incidence[u] |= 1 << i
+        incidence[v] |= 1 << i
+    return {
+        "vertices": vertices,
+        "edges": edges,
+        "weights": weights,
+        "src": [u for u, _ in edges],
+        "dst": [v for _, v in edges],
+        "w": w,
+        "order": sorted(range(len(edges)), key=w.__getitem__),
+        "edge_index": {edge_key(u, v): i for i, (u, v) in enumerate(edges)},
+        "incidence": incidence,
+    }
+
+
+def mask_respects_degree_constraints(graph, mask: int,
+                                     degree_bounds: Dict[int, int]) -> bool:
+    """
+    Checks the degree constraints of a tree given as an edge-index bitmask.
 
-    adj = build_adjacency(vertices, edges)
-    visited = set()
-    queue = deque([next(iter(vertices))])
+    The degree of v is the popcount of mask & incidence[v]. The bounds
+    may be a dict or a flat list indexed by vertex id.
+    """
+    for v, incident in enumerate(graph["incidence"]):
+        if (mask & incident).bit_count() > degree_bounds[v]:
+            return False
+    return True
 
-    while queue:
-        current = queue.popleft()
-        if current not in visited:
-            visited.add(current)
-            queue.extend(adj[current] - visited)
 
-    return visited == vertices
+def swap_respects_degree_constraints(graph, mask: int, added_edge: int,
+                                     degree_bounds: Dict[int, int]) -> bool:
+    """
+    Checks the degree constraints of a tree obtained by swapping
+    added_edge into a tree that already satisfied them.
 
-def connected_components(vertices, edges):
+    Only the endpoints of the added edge can gain a degree, so two
+    popcounts of mask & incidence[v] replace the check of every vertex.
     """
-    Returns connected components of a graph.
+    incidence = graph["incidence"]
+    u, v = graph["src"][added_edge], graph["dst"][added_edge]
+    return ((mask & incidence[u]).bit_count() <= degree_bounds[u]
+            and (mask & incidence[v]).bit_count() <= degree_bounds[v])
+
+
+def is_connected(vertices: Set[int], edges: list[Edge]) -> bool:
     """
-    adj = defaultdict(list)
-    for u, v in edges:
-        adj[u].append(v)
-        adj[v].append(u)
+    Checks whether the graph defined by edges is connected.
+    """
+    if not vertices:
+        return True
 
-    visited = set()
-    components = []
+    indptr, indices = build_csr(vertices, edges)
+    visited = [False] * len(vertices)
+    start = next(iter(vertices))
+    visited[start] = True
+    stack = [start]
+    reached = 1
 
-    for v in vertices:
-        if v not in visited:
-            stack = [v]
-            comp = set()
-            visited.add(v)
+    while stack:
+        current = stack.pop()
+        for j in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[j]
+            if not visited[neighbor]:
+                visited[neighbor] = True
+                reached += 1
+                stack.append(neighbor)
 
-            while stack:
-                x = stack.pop()
-                comp.add(x)
-                for y in adj[x]:
-                    if y not in visited:
-                        visited.add(y)
-                        stack.append(y)
+    return reached == len(vertices)
 
-            components.append(comp)
 
-    return components
+def root_tree(vertices: Set[int],
+              tree_edges: list[Edge]) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Roots a spanning tree at vertex 0 and labels it with a DFS
+    (Euler tour) numbering.
 
-def generate_neighbor(graph, tree_edges):
+    Returns parent (-1 for the root), tin and tout, where the subtree of
+    v is exactly the set of vertices z with tin[v] <= tin[z] <= tout[v].
+    Removing the tree edge (parent[v], v) splits the tree into that
+    interval and its complement.
     """
-    Generates a neighbor solution by edge exchange.
+    n = len(vertices)
+    indptr, indices = build_csr(vertices, tree_edges)
+    parent = [-1] * n
+    tin = [0] * n
+    visited = [False] * n
+    visited[0] = True
+    stack = [0]
+    order = []
+
+    while stack:
+        current = stack.pop()
+        tin[current] = len(order)
+        order.append(current)
+        for j in range(indptr[current], indptr[current + 1]):
+            child = indices[j]
+            if not visited[child]:
+                visited[child] = True
+                parent[child] = current
+                stack.append(child)
+
+    size = [1] * n
+    for v in reversed(order):
+        if parent[v] >= 0:
+            size[parent[v]] += size[v]
+
+    tout = [tin[v] + size[v] - 1 for v in range(n)]
+    return parent, tin, tout
+
+
+def replacement_edges(graph, tree_ids: List[int],
+                      parent: List[int], tin: List[int],
+                      tout: List[int]) -> Dict[int, List[int]]:
     """
-    vertices = graph["vertices"]
-    all_edges = set(graph["edges"])
+    For every tree edge, lists the non-tree edges that reconnect the
+    tree when it is removed, in non-decreasing weight (graph["order"]).
 
-    tree_edges = set(tree_edges)
+    A non-tree edge (x, y) is a replacement for exactly the tree edges
+    on the tree path between x and y (its fundamental cycle). The path
+    is walked upwards from both endpoints until reaching an ancestor of
+    the other one, using the numbering returned by root_tree.
+    """
+    src = graph["src"]
+    dst = graph["dst"]
+    parent_edge = [-1] * len(parent)
+    replacements = {}
+    for i in tree_ids:
+        u, v = src[i], dst[i]
+        parent_edge[v if parent[v] == u else u] = i
+        replacements[i] = []
+
+    for i in graph["order"]:
+        if i in replacements:
+            continue
+        x, y = src[i], dst[i]
+        for z, other in ((x, y), (y, x)):
+            while not tin[z] <= tin[other] <= tout[z]:
+                replacements[parent_edge[z]].append(i)
+                z = parent[z]
 
-    removed_edge = random.choice(tuple(tree_edges))
-    new_tree = tree_edges - {removed_edge}
+    return replacements
 
-    components = connected_components(vertices, new_tree)
-    if len(components) != 2:
-        return None
 
-    comp_a, comp_b = components
+def crossing_edges(graph, component: Set[int]) -> List[int]:
+    """
+    Returns the ids of the edges with exactly one endpoint in component.
 
-    candidate_edges = [
-        (u, v) for (u, v) in all_edges
-        if (u in comp_a and v in comp_b) or
-           (u in comp_b and v in comp_a)
+    The component is first spread into a flat per-vertex flag list, so
+    the scan over the edge arrays does list indexing only.
+    """
+    side = [False] * len(graph["vertices"])
+    for v in component:
+        side[v] = True
+    return [
+        i for i, (u, v) in enumerate(zip(graph["src"], graph["dst"]))
+        if side[u] != side[v]
     ]
 
-    if not candidate_edges:
-        return None
 
-    added_edge = random.choice(candidate_edges)
-    new_tree.add(added_edge)
+def generate_neighbors(graph, tree_ids: List[int], count: int, rng=random):
+    """
+    Lazily draws up to count independent edge-exchange moves of the
+    same tree.
+
+    The tree is given as its list of edge ids and each move is the pair
+    (position in tree_ids of the removed edge, added edge id). Random
+    draws come from rng (a random.Random, or the random module). The
+    tree is rooted once for the whole batch: removing tree edge
+    (parent[c], c) cuts off the vertices numbered tin[c]..tout[c], so
+    no traversal is needed per move. Moves are drawn only as they are
+    consumed. Yields nothing if tree_ids is not a spanning tree.
+    """
+    vertices = graph["vertices"]
+    src = graph["src"]
+    dst = graph["dst"]
+    tree_edges = [(src[i], dst[i]) for i in tree_ids]
+
+    if not tree_ids or not is_tree(vertices, tree_edges):
+        return
+
+    parent, tin, tout = root_tree(vertices, tree_edges)
+    preorder = [0] * len(tin)
+    for v, t in enumerate(tin):
+        preorder[t] = v
 
-    return new_tree
+    for _ in range(count):
+        removed_pos = rng.randrange(len(tree_ids))
+        u, v = tree_edges[removed_pos]
+        child = v if parent[v] == u else u
+        subtree = preorder[tin[child]:tout[child] + 1]
+        yield removed_pos, rng.choice(crossing_edges(graph, subtree))
 
 
-def generate_neighbor_with_move(graph, tree_edges):
+def neighbor_moves(graph, tree_mask) -> List[Tuple[int, int]]:
     """
-    Generates neighbors along with their corresponding move.
+    Lists every edge-swap move of a tree as (removed edge id, added edge id).
+
+    The tree is rooted once per call; removing tree edge (parent[c], c)
+    leaves the subtree of c, the DFS interval [tin[c], tout[c]], on one
+    side, so the crossing edges of every removal are found without a
+    graph traversal. Returns an empty list if the mask is not a tree.
     """
     vertices = graph["vertices"]
-    all_edges = set(graph["edges"])
-    tree_edges = set(tree_edges)
+    src = graph["src"]
+    dst = graph["dst"]
+    tree_ids = edge_ids_from_mask(tree_mask)
+    tree_edges = [(src[i], dst[i]) for i in tree_ids]
 
-    for removed_edge in tree_edges:
-        partial_tree = tree_edges - {removed_edge}
-        components = connected_components(vertices, partial_tree)
+    if not tree_ids or not is_tree(vertices, tree_edges):
+        return []
 
-        if len(components) != 2:
-            continue
-
-        comp_a, comp_b = components
+    parent, tin, tout = root_tree(vertices, tree_edges)
+    tin_src = [tin[u] for u in src]
+    tin_dst = [tin[v] for v in dst]
+    moves = []
 
-        for edge in all_edges:
-            u, v = edge
-            if (u in comp_a and v in comp_b) or \
-               (u in comp_b and v in comp_a):
+    for removed_edge in tree_ids:
+        u, v = src[removed_edge], dst[removed_edge]
+        child = v if parent[v] == u else u
+        lo, hi = tin[child], tout[child]
 
-                new_tree = partial_tree | {edge}
-                move = (removed_edge, edge)
+        moves.extend(
+            (removed_edge, edge)
+            for edge, (a, b) in enumerate(zip(tin_src, tin_dst))
+            if (lo <= a <= hi) != (lo <= b <= hi)
+        )
 
-                yield new_tree, move
+    return moves
 
 
 def is_tree(vertices, tree_edges):
     """
     Checks if a set of edges forms a spanning tree.
+
+    With exactly n-1 edges, being acyclic and being connected are
+    equivalent, so a single Union-Find cycle check suffices.
     """
     if len(tree_edges) != len(vertices) - 1:
         return False
 
-    parent = {v: v for v in vertices}
-
-    def find(v):
-        while parent[v] != v:
-            parent[v] = parent[parent[v]]
-            v = parent[v]
-        return v
-
-    def union(a, b):
-        ra, rb = find(a), find(b)
-        if ra == rb:
-            return False
-        parent[rb] = ra
-        return True
+    union_find = UnionFind(len(vertices))
 
     for u, v in tree_edges:
-        if not union(u, v):
+        if not union_find.union(u, v):
             return False
 
-    root = find(vertices[0])
-    return all(find(v) == root for v in vertices)
+    return True
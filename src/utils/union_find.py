@@ -5,25 +5,30 @@ Disjoint Set Union (Union-Find) data structure.
 Used for cycle detection and connectivity checks.
 """
 
-from typing import Set
-
 
 class UnionFind:
     """
-    Union-Find data structure with path compression.
+    Union-Find data structure with path halving and union by rank.
+
+    Parents and ranks are stored in flat lists indexed by vertex id,
+    so vertices must be labelled 0..n-1.
     """
 
-    def __init__(self, vertices: Set[int]):
-        self.parent = {v: v for v in vertices}
-        self.rank = {v: 0 for v in vertices}
+    def __init__(self, num_vertices: int):
+        self.parent = list(range(num_vertices))
+        self.rank = [0] * num_vertices
+        self.num_components = num_vertices
 
     def find(self, x: int) -> int:
         """
-        Finds the representative of x with path compression.
+        Finds the representative of x with path halving
+        (every visited node is pointed to its grandparent).
         """
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
 
     def union(self, x: int, y: int) -> bool:
         """
@@ -43,4 +48,5 @@ class UnionFind:
             self.parent[ry] = rx
             self.rank[rx] += 1
 
+        self.num_components -= 1
         return True